@@ -1,4 +1,39 @@
 import ast
+import re
+from typing import NamedTuple
+
+try:
+    # optional Rust-backed traversal, several times faster than walking in Python
+    from fast_walk import walk_unordered as _walk_nodes
+except ImportError:
+    _walk_nodes = None
+
+try:
+    # optional, parses and serializes several times faster than the stdlib json module
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        # definitions are tuple subclasses, which orjson only handles through default
+        return orjson.dumps(obj, default=list)
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    # optional, parses without building a Python object per node
+    import tree_sitter
+    import tree_sitter_python
+except ImportError:
+    tree_sitter = None
+
+# built on first use, False once construction has failed
+_tree_sitter_parser = None
 
 
 CONFIG_EXCLUDE_FOLDERS = "exclude_folders"
@@ -9,6 +44,14 @@ CONFIG_REPORT_PERCENT_ONLY = "report_percent_only"
 CONFIG_SKIP_MODULES = "skip_modules"
 CONFIG_SKIP_CLASSES = "skip_classes"
 CONFIG_SKIP_FUNCTIONS = "skip_functions"
+CONFIG_SKIP_HIDDEN_FOLDERS = "skip_hidden_folders"
+# tree-sitter accepts some code that ast rejects, e.g. Python 2 expressions or a bad encoding
+# declaration, so with this setting such files may be counted instead of raising a syntax error
+CONFIG_USE_TREE_SITTER = "use_tree_sitter"
+
+CACHE_FOLDER = ".pydoccoverage-cache"
+CACHE_FILE = "cache.json"
+CACHE_VERSION = 3
 
 CONFIG_FIELDS = [
     CONFIG_EXCLUDE_FOLDERS,
@@ -18,12 +61,22 @@ CONFIG_FIELDS = [
     CONFIG_REPORT_PERCENT_ONLY,
     CONFIG_SKIP_MODULES,
     CONFIG_SKIP_CLASSES,
-    CONFIG_SKIP_FUNCTIONS
+    CONFIG_SKIP_FUNCTIONS,
+    CONFIG_SKIP_HIDDEN_FOLDERS,
+    CONFIG_USE_TREE_SITTER
 ]
 
+# excluded and hidden folders are pruned from the scan, so nothing below them is ever listed
 CONFIG_DEFAULT = {
     CONFIG_EXCLUDE_FOLDERS: [
-        "venv"
+        "venv",
+        ".venv",
+        ".git",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        "node_modules",
+        ".tox"
     ],
     CONFIG_EXCLUDE_FILES: [],
     CONFIG_SKIP_MAGIC: True,
@@ -31,136 +84,408 @@ CONFIG_DEFAULT = {
     CONFIG_REPORT_PERCENT_ONLY: False,
     CONFIG_SKIP_MODULES: False,
     CONFIG_SKIP_CLASSES: False,
-    CONFIG_SKIP_FUNCTIONS: False
+    CONFIG_SKIP_FUNCTIONS: False,
+    CONFIG_SKIP_HIDDEN_FOLDERS: True,
+    CONFIG_USE_TREE_SITTER: False
 }
 
 
+def _split_folder_patterns(patterns):
+    # patterns containing a "/" match the path relative to the scanned root,
+    # the rest match a folder name at any depth
+    import posixpath
+
+    name_literals = set()
+    name_globs = []
+    path_literals = set()
+    path_globs = []
+
+    for pattern in patterns:
+        # normpath drops a leading "./" and duplicate separators, matching how relative paths are built
+        pattern = posixpath.normpath(pattern.replace("\\", "/")).strip("/")
+        is_glob = any(c in pattern for c in "*?[")
+        if "/" in pattern:
+            if is_glob:
+                path_globs.append(pattern)
+            else:
+                path_literals.add(pattern)
+        elif is_glob:
+            name_globs.append(pattern)
+        else:
+            name_literals.add(pattern)
+    return frozenset(name_literals), name_globs, frozenset(path_literals), path_globs
+
+
 def _collect_python_files(root_folder, config):
     import os
+    from fnmatch import fnmatch
     py_files = []
-
-    for root, dirs, files in os.walk(root_folder):
-        dirs[:] = [d for d in dirs if d not in config[CONFIG_EXCLUDE_FOLDERS]]
-        for file in files:
-            if file.endswith(".py") and file not in config[CONFIG_EXCLUDE_FILES]:
-                py_files.append(os.path.join(root, file))
+    name_literals, name_globs, path_literals, path_globs = _split_folder_patterns(config[CONFIG_EXCLUDE_FOLDERS])
+    excluded_files = frozenset(config[CONFIG_EXCLUDE_FILES])
+    check_paths = bool(path_literals or path_globs)
+    skip_hidden = config[CONFIG_SKIP_HIDDEN_FOLDERS]
+
+    def is_excluded(rel_root, folder):
+        if skip_hidden and folder.startswith("."):
+            return True
+        if folder in name_literals or any(fnmatch(folder, p) for p in name_globs):
+            return True
+        if not check_paths:
+            return False
+        rel_path = folder if rel_root == "." else f"{rel_root}/{folder}"
+        return rel_path in path_literals or any(fnmatch(rel_path, p) for p in path_globs)
+
+    def scan(folder, rel_root):
+        # DirEntry caches the file type from the directory read, so no extra stat per entry
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            return
+        sub_folders = []
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if not is_excluded(rel_root, name):
+                    sub_folders.append(entry)
+            elif name.endswith(".py") and name not in excluded_files and entry.is_file():
+                py_files.append(entry.path)
+        for entry in sub_folders:
+            scan(entry.path, entry.name if rel_root == "." else f"{rel_root}/{entry.name}")
+
+    scan(root_folder, ".")
     return py_files
 
 
-def count_matching(iterable, *predicates):
+# files matching neither pattern are recorded as empty without being parsed, so their syntax is never
+# checked: an invalid file such as "x = (" or a Python 2 script without definitions is reported as an
+# undocumented module instead of raising a syntax error
+_DEFINITION_KEYWORD = re.compile(rb"\b(?:def|class)\b")
+# blank and comment lines, then anything that could start a str literal as the first statement
+_LEADING_STRING = re.compile(rb"(?:\xef\xbb\xbf)?(?:[ \t\f]*(?:#[^\r\n]*)?(?:\r\n|\r|\n))*[ \t\f]*[rRuU]?[\"'(\\]")
+
+
+# AST node classes are never subclassed, so matching on type identity is exact
+_CLASS_TYPE = ast.ClassDef
+_FUNCTION_TYPES = frozenset((ast.FunctionDef, ast.AsyncFunctionDef))
+
+
+class Definition(NamedTuple):
     """
-    Check the number of elements in a collection matching given predicates
-    :param iterable: The container to check the elements of
-    :param predicates: Any number of functions to check the elements again
-    :return: A tuple, where each element is the number of elements matching the given predicate
+    A class or function found in a source file
     """
-    v = [0] * len(predicates)
-    for e in iterable:
-        for i, p in enumerate(predicates):
-            if p(e):
-                v[i] += 1
-    return tuple(v)
+    name: str
+    line: int
+    documented: bool
+
+
+# fields that hold nested statement lists; expressions can never contain a def or class
+_STATEMENT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _walk_statements(ast_tree):
+    stack = [ast_tree]
+    stack_pop = stack.pop
+    stack_extend = stack.extend
+    fields_by_type = {}
+
+    while stack:
+        node = stack_pop()
+        yield node
+        node_type = type(node)
+        fields = fields_by_type.get(node_type)
+        if fields is None:
+            fields = tuple(f for f in _STATEMENT_FIELDS if f in node_type._fields)
+            fields_by_type[node_type] = fields
+        for field in fields:
+            stack_extend(getattr(node, field))
+
+
+if _walk_nodes is None:
+    _walk_nodes = _walk_statements
+
+
+def _has_docstring(node):
+    # same test as ast.get_docstring, without cleaning up the text that is never used
+    body = node.body
+    if not body:
+        return False
+    first = body[0]
+    return type(first) is ast.Expr and type(first.value) is ast.Constant and type(first.value.value) is str
+
+
+def _make_skip(skip_magic, skip_private):
+    # private names include magic ones, so a single check covers both flags
+    if skip_private:
+        return lambda name: name[:1] == "_"
+    if skip_magic:
+        return lambda name: name[:2] == "__" and name[-2:] == "__"
+    return lambda name: False
+
+
+def _collect_with_ast(file_data, file_source, file_path, skip):
+    ast_tree = ast.parse(file_source, filename=file_path, type_comments=False)
+
+    file_data["module_documented"] = _has_docstring(ast_tree)
+
+    class_type = _CLASS_TYPE
+    function_types = _FUNCTION_TYPES
+    documented_classes = 0
+    documented_functions = 0
+    classes_append = file_data["classes"].append
+    functions_append = file_data["functions"].append
+    has_docstring = _has_docstring
+
+    for node in _walk_nodes(ast_tree):
+        node_type = type(node)
+        if node_type is class_type:
+            documented = has_docstring(node)
+            if documented:
+                documented_classes += 1
+            classes_append(Definition(node.name, node.lineno, documented))
+        elif node_type in function_types:
+            name = node.name
+            if skip(name):
+                continue
+            documented = has_docstring(node)
+            if documented:
+                documented_functions += 1
+            functions_append(Definition(name, node.lineno, documented))
+
+    return documented_classes, documented_functions
+
+
+# Python 2 statements the tree-sitter grammar parses without flagging an error
+_TREE_SITTER_PY2_STATEMENTS = frozenset(("print_statement", "exec_statement"))
+
+# tree-sitter nodes that can hold a def or class somewhere below them
+_TREE_SITTER_CONTAINERS = frozenset((
+    "module",
+    "block",
+    "decorated_definition",
+    "class_definition",
+    "function_definition",
+    "if_statement",
+    "elif_clause",
+    "else_clause",
+    "for_statement",
+    "while_statement",
+    "try_statement",
+    "except_clause",
+    "except_group_clause",
+    "finally_clause",
+    "with_statement",
+    "match_statement",
+    "case_clause"
+))
+
+
+def _tree_sitter_is_str(node):
+    # mirrors what the compiler folds into a str constant: plain, raw or unicode literals,
+    # implicitly concatenated or parenthesized
+    node_type = node.type
+    if node_type == "string":
+        prefix = node.children[0].text
+        return not any(c in prefix for c in b"bBfFtT")
+    if node_type == "concatenated_string":
+        return all(_tree_sitter_is_str(c) for c in node.named_children if c.type != "comment")
+    if node_type == "parenthesized_expression":
+        inner = [c for c in node.named_children if c.type != "comment"]
+        return len(inner) == 1 and _tree_sitter_is_str(inner[0])
+    return False
+
+
+def _tree_sitter_has_docstring(body):
+    for statement in body.named_children:
+        if statement.type == "comment":
+            continue
+        if statement.type != "expression_statement" or statement.named_child_count != 1:
+            return False
+        return _tree_sitter_is_str(statement.named_children[0])
+    return False
+
+
+def _get_tree_sitter_parser():
+    global _tree_sitter_parser
+    if _tree_sitter_parser is None:
+        try:
+            _tree_sitter_parser = tree_sitter.Parser(tree_sitter.Language(tree_sitter_python.language()))
+        except (TypeError, ValueError):
+            # bindings older than 0.22 take different constructor arguments
+            _tree_sitter_parser = False
+    return _tree_sitter_parser
+
+
+def _collect_with_tree_sitter(file_data, file_source, skip):
+    parser = _get_tree_sitter_parser()
+    if not parser:
+        return None
+    root = parser.parse(file_source).root_node
+    if root.has_error:
+        # leave invalid or unsupported syntax to ast, which reports it properly
+        return None
+
+    # results are only stored once the whole tree is accepted, so a fallback to ast starts clean
+    documented_classes = 0
+    documented_functions = 0
+    classes = []
+    functions = []
+    classes_append = classes.append
+    functions_append = functions.append
+    containers = _TREE_SITTER_CONTAINERS
+    py2_statements = _TREE_SITTER_PY2_STATEMENTS
+    stack = [root]
+    stack_pop = stack.pop
+    stack_append = stack.append
+
+    while stack:
+        node = stack_pop()
+        node_type = node.type
+        if node_type == "class_definition" or node_type == "function_definition":
+            name = node.child_by_field_name("name").text.decode("utf-8", "replace")
+            is_class = node_type == "class_definition"
+            if is_class or not skip(name):
+                documented = _tree_sitter_has_docstring(node.child_by_field_name("body"))
+                definition = Definition(name, node.start_point[0] + 1, documented)
+                if is_class:
+                    if documented:
+                        documented_classes += 1
+                    classes_append(definition)
+                else:
+                    if documented:
+                        documented_functions += 1
+                    functions_append(definition)
+        for child in node.named_children:
+            child_type = child.type
+            if child_type in containers:
+                stack_append(child)
+            elif child_type in py2_statements:
+                # not valid Python 3, so let ast raise the syntax error
+                return None
+
+    file_data["module_documented"] = _tree_sitter_has_docstring(root)
+    file_data["classes"] = classes
+    file_data["functions"] = functions
+    return documented_classes, documented_functions
 
 
 def _analyze_file(file_path, config):
-    # returns a dictionary with the module docstring and the docstrings of each function
+    # returns a dictionary with whether the module and each class and function is documented
 
     file_data = {
-        "module_docstring": None,
+        "module_documented": False,
         "class_coverage": {
             "documented": 0,
             "total": 0,
-            "percentage": 1.0
+            "percentage": 0.0
         },
         "function_coverage": {
             "documented": 0,
             "total": 0,
-            "percentage": 1.0
+            "percentage": 0.0
         },
         "classes": [],
         "functions": []
     }
 
     file_source = None
-    with open(file_path, "r") as source:
+    with open(file_path, "rb") as source:
         file_source = source.read()
 
-    ast_tree = ast.parse(file_source)
+    # without a def/class keyword or a leading string there is nothing to find, so skip the parse,
+    # and with it the syntax check
+    if _DEFINITION_KEYWORD.search(file_source) is None and _LEADING_STRING.match(file_source) is None:
+        return file_data
 
-    file_data["module_docstring"] = ast.get_docstring(ast_tree)
+    skip = _make_skip(config[CONFIG_SKIP_MAGIC], config[CONFIG_SKIP_PRIVATE])
+    counts = None
+    if config[CONFIG_USE_TREE_SITTER] and tree_sitter is not None:
+        counts = _collect_with_tree_sitter(file_data, file_source, skip)
+    if counts is None:
+        counts = _collect_with_ast(file_data, file_source, file_path, skip)
+    documented_classes, documented_functions = counts
+    classes = file_data["classes"]
+    functions = file_data["functions"]
 
-    for node in ast.walk(ast_tree):
-        if isinstance(node, ast.ClassDef):
-            file_data["classes"].append({
-                "name": node.name,
-                "line": node.lineno,
-                "docstring": ast.get_docstring(node)
-            })
-        if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-            if config[CONFIG_SKIP_MAGIC] and node.name.startswith("__") and node.name.endswith("__"):
-                continue
-            if config[CONFIG_SKIP_PRIVATE] and node.name.startswith("_"):
-                continue
-            file_data["functions"].append({
-                "name": node.name,
-                "line": node.lineno,
-                "docstring": ast.get_docstring(node)
-            })
+    # the walk order depends on the traversal in use, so report in source order
+    classes.sort(key=lambda a: a.line)
+    functions.sort(key=lambda a: a.line)
 
-    documented_classes = count_matching(file_data["classes"], lambda a: a["docstring"] is not None)
-    total_classes = len(file_data["classes"])
+    total_classes = len(classes)
 
     file_data["class_coverage"] = {
-        "documented": documented_classes[0],
+        "documented": documented_classes,
         "total": total_classes,
-        "percentage": documented_classes[0] / max(total_classes, 1)
+        "percentage": documented_classes / (total_classes or 1)
     }
 
-    documented_functions = count_matching(file_data["functions"], lambda a: a["docstring"] is not None)
-    total_functions = len(file_data["functions"])
+    total_functions = len(functions)
 
     file_data["function_coverage"] = {
-        "documented": documented_functions[0],
+        "documented": documented_functions,
         "total": total_functions,
-        "percentage": documented_functions[0] / max(total_functions, 1)
+        "percentage": documented_functions / (total_functions or 1)
     }
 
     return file_data
 
 
+_worker_config = None
+
+
+def _init_worker(config):
+    global _worker_config
+    _worker_config = config
+
+
+def _analyze_file_worker(file_path):
+    return _analyze_file(file_path, _worker_config)
+
+
 def _report_data(ast_data, config):
+    import sys
+
+    # the whole report is written in one go rather than printed line by line
+    out = []
     if config[CONFIG_REPORT_PERCENT_ONLY]:
-        _report_percent_only(ast_data, config)
+        _report_percent_only(ast_data, config, out)
     else:
-        _report_all(ast_data, config)
+        _report_all(ast_data, config, out)
+    if out:
+        out.append("")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.flush()
 
 
-def _report_all(ast_data: dict, config):
+def _report_all(ast_data, config, out: list):
     classes_doc_total = 0
     functions_doc_total = 0
     classes_total = 0
     functions_total = 0
+    skip_modules = config[CONFIG_SKIP_MODULES]
+    skip_classes = config[CONFIG_SKIP_CLASSES]
+    skip_functions = config[CONFIG_SKIP_FUNCTIONS]
 
-    for file_name in ast_data:
-        file_data = ast_data[file_name]
+    for file_name, file_data in ast_data:
         file_reports = []
-        if config[CONFIG_SKIP_MODULES] is False:
-            if file_data["module_docstring"] is None and config[CONFIG_SKIP_MODULES] is False:
-                file_reports.append("Missing docstring for module")
-        if config[CONFIG_SKIP_CLASSES] is False:
+        file_reports_append = file_reports.append
+        if skip_modules is False:
+            if not file_data["module_documented"]:
+                file_reports_append("Missing docstring for module")
+        if skip_classes is False:
             for class_data in file_data["classes"]:
                 classes_total += 1
-                if class_data["docstring"] is None:
-                    lineno = class_data["line"]
-                    file_reports.append(f"Line {lineno}: Missing docstring for class \'{class_data['name']}\'")
+                if not class_data.documented:
+                    lineno = class_data.line
+                    file_reports_append(f"Line {lineno}: Missing docstring for class \'{class_data.name}\'")
                 else:
                     classes_doc_total += 1
-        if config[CONFIG_SKIP_FUNCTIONS] is False:
+        if skip_functions is False:
             for function_data in file_data["functions"]:
                 functions_total += 1
-                if function_data["docstring"] is None:
-                    lineno = function_data["line"]
-                    file_reports.append(f"Line {lineno}: Missing docstring for function \'{function_data['name']}\'")
+                if not function_data.documented:
+                    lineno = function_data.line
+                    file_reports_append(f"Line {lineno}: Missing docstring for function \'{function_data.name}\'")
                 else:
                     functions_doc_total += 1
         if file_reports:
@@ -177,18 +502,17 @@ def _report_all(ast_data: dict, config):
                 reports_delimited,
                 "\n"
             ]
-            print("\n".join(report_sections))
+            out.append("\n".join(report_sections))
 
-    total_class_perc = (classes_doc_total / classes_total) * 100
-    total_functions_perc = (functions_doc_total / functions_total) * 100
-    print("Total Coverage")
-    print(f"{classes_doc_total} of {classes_total} classes documented ({total_class_perc:.1f}%)")
-    print(f"{functions_doc_total} of {functions_total} functions documented ({total_functions_perc:.1f}%)")
+    total_class_perc = (classes_doc_total / (classes_total or 1)) * 100
+    total_functions_perc = (functions_doc_total / (functions_total or 1)) * 100
+    out.append("Total Coverage")
+    out.append(f"{classes_doc_total} of {classes_total} classes documented ({total_class_perc:.1f}%)")
+    out.append(f"{functions_doc_total} of {functions_total} functions documented ({total_functions_perc:.1f}%)")
 
 
-def _report_percent_only(ast_data: dict, config):
-    for file_name in ast_data:
-        file_data = ast_data[file_name]
+def _report_percent_only(ast_data, config, out: list):
+    for file_name, file_data in ast_data:
         class_cov = file_data["class_coverage"]
         func_cov = file_data["function_coverage"]
         class_doc = class_cov["documented"]
@@ -198,7 +522,7 @@ def _report_percent_only(ast_data: dict, config):
         class_perc = class_cov["percentage"] * 100
         func_perc = func_cov["percentage"] * 100
         file_report_line = f"{file_name} | Classes: {class_doc}/{class_total} ({class_perc:.1f}%), Functions: {func_doc}/{func_total} ({func_perc:.1f}%)"
-        print(file_report_line)
+        out.append(file_report_line)
 
 
 def _overwrite_config(base, new):
@@ -209,22 +533,105 @@ def _overwrite_config(base, new):
     return base
 
 
+def _cache_settings(config):
+    # analysis results depend on these settings, so a change invalidates the whole cache
+    return [CACHE_VERSION, config[CONFIG_SKIP_MAGIC], config[CONFIG_SKIP_PRIVATE], config[CONFIG_USE_TREE_SITTER]]
+
+
+def _load_cache(config):
+    import os
+
+    # an unreadable or malformed cache is discarded rather than failing the run
+    try:
+        with open(os.path.join(CACHE_FOLDER, CACHE_FILE), "rb") as cache_file:
+            cache = _json_loads(cache_file.read())
+        if cache.get("settings") != _cache_settings(config):
+            return {}
+        files = cache.get("files", {})
+        # json stores definitions as plain lists
+        for _, file_data in files.values():
+            file_data["classes"] = [Definition(*d) for d in file_data["classes"]]
+            file_data["functions"] = [Definition(*d) for d in file_data["functions"]]
+    except Exception:
+        return {}
+    return files
+
+
+def _is_utf8_encodable(text):
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _save_cache(files, config):
+    import os
+
+    # names with undecodable bytes come back from scandir surrogate-escaped, which orjson refuses;
+    # leaving those files uncached keeps both json writers producing the same cache
+    files = {path: entry for path, entry in files.items() if _is_utf8_encodable(path)}
+    # serialize before opening so a failure cannot truncate the existing cache
+    try:
+        data = _json_dumps({"settings": _cache_settings(config), "files": files})
+    except (TypeError, ValueError):
+        return
+    try:
+        os.makedirs(CACHE_FOLDER, exist_ok=True)
+        with open(os.path.join(CACHE_FOLDER, CACHE_FILE), "wb") as cache_file:
+            cache_file.write(data)
+    except OSError:
+        pass
+
+
+def _iter_file_data(py_files, config, cache, new_cache):
+    import os
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    # stat calls are I/O bound, so overlapping them hides latency on slow or network filesystems
+    with ThreadPoolExecutor(max_workers=8) as stat_executor:
+        stats = list(stat_executor.map(os.stat, py_files))
+
+    # unchanged files are served from the cache, keyed by modification time and size
+    stamps = []
+    stale_files = []
+    for file, stat in zip(py_files, stats):
+        cache_key = os.path.abspath(file)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cached = cache.get(cache_key)
+        if cached is None or cached[0] != stamp:
+            stale_files.append(file)
+        stamps.append((cache_key, stamp, cached))
+
+    # config is handed to each worker once by the initializer instead of being pickled per task
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(config,)) as executor:
+        results = executor.map(_analyze_file_worker, stale_files, chunksize=16)
+        for file, (cache_key, stamp, cached) in zip(py_files, stamps):
+            if cached is not None and cached[0] == stamp:
+                data = cached[1]
+            else:
+                data = next(results)
+            new_cache[cache_key] = [stamp, data]
+            yield file, data
+
+
 def run():
     import sys
-    import json
 
     config = CONFIG_DEFAULT
     try:
-        with open(sys.argv[2], "r") as conf:
-            config = _overwrite_config(config, json.load(conf))
+        with open(sys.argv[2], "rb") as conf:
+            config = _overwrite_config(config, _json_loads(conf.read()))
     except Exception as e:
         pass
 
     py_files = _collect_python_files(sys.argv[1], config)
-    file_data = {}
-    for file in py_files:
-        file_data[file] = _analyze_file(file, config)
-    _report_data(file_data, config)
+    cache = _load_cache(config)
+    new_cache = {}
+    # results are handed to the reporter in scan order without first collecting them in a separate dict;
+    # the report itself is still buffered and the cache still holds every result until the end of the run
+    _report_data(_iter_file_data(py_files, config, cache, new_cache), config)
+    _save_cache(new_cache, config)
 
 
 if __name__ == "__main__":